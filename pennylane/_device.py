@@ -379,7 +379,7 @@ class Device(abc.ABC):
         return cls._capabilities
 
     # pylint: disable=too-many-branches
-    def execute(self, queue, observables, parameters={}, **kwargs):
+    def execute(self, queue, observables, parameters=None, **kwargs):
         """Execute a queue of quantum operations on the device and then measure the given observables.
 
         For plugin developers: Instead of overwriting this, consider implementing a suitable subset of
@@ -406,7 +406,9 @@ class Device(abc.ABC):
         self._op_queue = queue
         self._obs_queue = observables
         self._parameters = {}
-        self._parameters.update(parameters)
+
+        if parameters is not None:
+            self._parameters.update(parameters)
 
         results = []
         if self._shot_vector is not None:
@@ -36,15 +36,20 @@ def compute_vjp(dy, jac):
     if jac is None:
         return None
 
-    dy_row = math.reshape(dy, [-1])
+    # If both inputs are NumPy arrays, they are not being traced by an autodiff
+    # framework, and NumPy can be used directly instead of dispatching via qml.math.
+    concrete = isinstance(dy, np.ndarray) and isinstance(jac, np.ndarray)
+    _math = np if concrete else math
+
+    dy_row = _math.reshape(dy, [-1])
 
     if not isinstance(dy_row, np.ndarray):
         jac = math.convert_like(jac, dy_row)
 
-    jac = math.reshape(jac, [dy_row.shape[0], -1])
+    jac = _math.reshape(jac, [dy_row.shape[0], -1])
 
     try:
-        if math.allclose(dy, 0):
+        if _math.allclose(dy, 0):
             # If the dy vector is zero, then the
             # corresponding element of the VJP will be zero.
             num_params = jac.shape[1]
@@ -52,6 +57,12 @@ def compute_vjp(dy, jac):
     except (AttributeError, TypeError):
         pass
 
+    if concrete:
+        # For NumPy arrays, the contraction over the output dimension is
+        # a vector-matrix product, which is dispatched directly to BLAS
+        # without the intermediate transposes of ``tensordot``.
+        return dy_row @ jac
+
     return math.tensordot(jac, dy_row, [[0], [0]])
 
 
@@ -292,7 +303,6 @@ def batch_vjp(tapes, dys, gradient_fn, reduction="append", gradient_kwargs=None)
             [-9.2973e-02, -1.0772e+00,  4.7184e-09]], dtype=torch.float64)
     """
     gradient_kwargs = gradient_kwargs or {}
-    reshape_info = []
     gradient_tapes = []
     processing_fns = []
 
@@ -300,22 +310,19 @@ def batch_vjp(tapes, dys, gradient_fn, reduction="append", gradient_kwargs=None)
     for tape, dy in zip(tapes, dys):
         g_tapes, fn = vjp(tape, dy, gradient_fn, gradient_kwargs)
 
-        reshape_info.append(len(g_tapes))
-        processing_fns.append(fn)
+        # Store the processing function of each tape alongside the
+        # slice of the flat results list containing the tape results.
+        start = len(gradient_tapes)
         gradient_tapes.extend(g_tapes)
+        processing_fns.append((fn, slice(start, len(gradient_tapes))))
 
     def processing_fn(results):
         vjps = []
-        start = 0
-
-        for t_idx in range(len(tapes)):
-            # extract the correct results from the flat list
-            res_len = reshape_info[t_idx]
-            res_t = results[start : start + res_len]
-            start += res_len
 
-            # postprocess results to compute the VJP
-            vjp_ = processing_fns[t_idx](res_t)
+        for fn, res_slice in processing_fns:
+            # extract the correct results from the flat list, and
+            # postprocess the results to compute the VJP
+            vjp_ = fn(results[res_slice])
 
             if vjp_ is None:
                 if reduction == "append":
@@ -212,11 +212,10 @@ def nuclear_energy(charges, r):
             coor = args[0]
         else:
             coor = r
-        e = 0
-        for i, r1 in enumerate(coor):
-            for j, r2 in enumerate(coor[i + 1 :]):
-                e = e + (charges[i] * charges[i + j + 1] / anp.linalg.norm(r1 - r2))
-        return e
+        # compute the repulsion of all nuclear pairs i < j at once
+        i, j = anp.triu_indices(len(charges), k=1)
+        q = anp.array(charges)
+        return anp.sum(q[i] * q[j] / anp.linalg.norm(coor[i] - coor[j], axis=1))
 
     return nuclear
 
@@ -16,6 +16,8 @@ This module contains functions for adding the Autograd interface
 to a PennyLane Device class.
 """
 # pylint: disable=too-many-arguments
+import itertools
+
 import autograd
 from autograd.numpy.numpy_boxes import ArrayBox
 
@@ -49,14 +51,39 @@ def execute(tapes, device, execute_fn, gradient_fn, gradient_kwargs, _n=1, max_d
         list[list[float]]: A nested list of tape results. Each element in
         the returned list corresponds in order to the provided tapes.
     """
+    parameters = []
+
     for tape in tapes:
-        # set the trainable parameters
+        # set the trainable parameters; with Autograd, a parameter is trainable
+        # if it is an ArrayBox or a tensor with ``requires_grad=True``
         params = tape.get_parameters(trainable_only=False)
-        tape.trainable_params = qml.math.get_trainable_indices(params)
-
-    parameters = autograd.builtins.tuple(
-        [autograd.builtins.list(t.get_parameters()) for t in tapes]
-    )
+        trainable = [
+            idx
+            for idx, p in enumerate(params)
+            if getattr(p, "requires_grad", False) or isinstance(p, ArrayBox)
+        ]
+        tape.trainable_params = set(trainable)
+
+        # Extract the trainable parameters from the parameters already
+        # gathered, rather than querying the tape a second time.
+        parameters.append([params[idx] for idx in trainable])
+
+    if not any(parameters):
+        # None of the tapes have trainable parameters, so there is nothing for
+        # Autograd to trace; bypass the Autograd containers and primitive,
+        # and directly evaluate the wrapped execution function.
+        return _execute.fun(
+            parameters,
+            tapes=tapes,
+            device=device,
+            execute_fn=execute_fn,
+            gradient_fn=gradient_fn,
+            gradient_kwargs=gradient_kwargs,
+            _n=_n,
+            max_diff=max_diff,
+        )[0]
+
+    parameters = autograd.builtins.tuple([autograd.builtins.list(p) for p in parameters])
 
     return _execute(
         parameters,
@@ -80,7 +107,7 @@ def _execute(
     gradient_kwargs=None,
     _n=1,
     max_diff=2,
-):  # pylint: disable=dangerous-default-value,unused-argument
+):  # pylint: disable=unused-argument
     """Autodifferentiable wrapper around ``Device.batch_execute``.
 
     The signature of this function is designed to work around Autograd restrictions.
@@ -128,7 +155,7 @@ def vjp(
     gradient_kwargs=None,
     _n=1,
     max_diff=2,
-):  # pylint: disable=dangerous-default-value,unused-argument
+):  # pylint: disable=unused-argument
     """Returns the vector-Jacobian product operator for a batch of quantum tapes.
 
     Args:
@@ -176,8 +203,16 @@ def vjp(
             if isinstance(gradient_fn, qml.gradients.gradient_transform):
                 # Gradient function is a gradient transform.
 
+                # Higher-order derivatives are only being requested if the
+                # parameters or the output gradients are themselves Autograd
+                # ArrayBoxes. If not, or if the maximum derivative order has been
+                # reached, there is no need to recursively call ``execute``.
+                higher_order = any(
+                    isinstance(p, ArrayBox) for p in itertools.chain(*parameters, dy)
+                )
+
                 # Generate and execute the required gradient tapes
-                if _n == max_diff:
+                if _n == max_diff or not higher_order:
                     with qml.tape.Unwrap(*tapes, set_trainable=False):
                         vjp_tapes, processing_fn = qml.gradients.batch_vjp(
                             tapes,
@@ -19,7 +19,9 @@ from autograd.numpy.numpy_boxes import ArrayBox
 from autoray import numpy as np
 from numpy import ndarray
 
-from . import single_dispatch  # pylint:disable=unused-import
+from pennylane.numpy.tensor import tensor as pnp_tensor
+
+from .single_dispatch import _unwrap_arraybox, _unwrap_arraybox_full
 from .utils import cast, get_interface, requires_grad
 
 
@@ -462,6 +464,22 @@ def scatter_element_add(tensor, index, value, like=None):
     return np.scatter_element_add(tensor, index, value, like=interface)
 
 
+_UNWRAP_DISPATCH = {
+    float: lambda t, max_depth: t,
+    int: lambda t, max_depth: t,
+    pnp_tensor: lambda t, max_depth: t.numpy(),
+    ArrayBox: lambda t, max_depth: (
+        _unwrap_arraybox_full(t) if max_depth is None else _unwrap_arraybox(t, max_depth)
+    ),
+}
+"""dict[type, callable]: maps the exact types most commonly encountered by :func:`~.unwrap`
+to their unwrapping functions, bypassing the autoray dispatch for these types"""
+
+
+def _unwrap_generic(t, max_depth):  # pylint: disable=unused-argument
+    return np.to_numpy(t)
+
+
 def unwrap(values, max_depth=None):
     """Unwrap a sequence of objects to NumPy arrays.
 
@@ -495,10 +513,7 @@ def unwrap(values, max_depth=None):
     res = []
 
     for t in values:
-        if isinstance(t, ArrayBox):
-            a = np.to_numpy(t, max_depth=max_depth)
-        else:
-            a = np.to_numpy(t)
+        a = _UNWRAP_DISPATCH.get(type(t), _unwrap_generic)(t, max_depth)
 
         if isinstance(a, ndarray) and not a.shape:
             # if NumPy array is scalar, convert to a Python float
@@ -92,14 +92,28 @@ def _block_diag_autograd(tensors):
 ar.register_function("autograd", "block_diag", _block_diag_autograd)
 
 
+def _unwrap_arraybox_full(arraybox):
+    # Fully unwrap nested ArrayBoxes; this is the common case,
+    # and avoids checking the depth at every nesting level.
+    val = arraybox
+
+    while hasattr(val, "_value"):
+        val = val._value
+
+    return val
+
+
 def _unwrap_arraybox(arraybox, max_depth=None, _n=0):
-    if max_depth is not None and _n == max_depth:
-        return arraybox
+    # Unwrap nested ArrayBoxes iteratively; each nesting level corresponds
+    # to one order of differentiation.
+    val = arraybox
 
-    val = getattr(arraybox, "_value", arraybox)
+    while hasattr(val, "_value"):
+        if _n == max_depth:
+            break
 
-    if hasattr(val, "_value"):
-        return _unwrap_arraybox(val, max_depth=max_depth, _n=_n + 1)
+        val = val._value
+        _n += 1
 
     return val
 
@@ -108,7 +122,10 @@ def _to_numpy_autograd(x, max_depth=None, _n=0):
     if hasattr(x, "_value"):
         # Catches the edge case where the data is an Autograd arraybox,
         # which only occurs during backpropagation.
-        return _unwrap_arraybox(x, max_depth=max_depth, _n=_n)
+        if max_depth is None:
+            return _unwrap_arraybox_full(x)
+
+        return _unwrap_arraybox(x, max_depth, _n)
 
     return x.numpy()
 
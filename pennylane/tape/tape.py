@@ -802,13 +802,13 @@ class QuantumTape(AnnotatedQueue):
         >>> tape.get_parameters(trainable_only=False)
         [0.432, 0.543, 0.133]
         """
-        params = []
-        iterator = sorted(self.trainable_params) if trainable_only else self._par_info
+        par_info = self._par_info
+        iterator = sorted(self.trainable_params) if trainable_only else par_info
 
+        params = []
         for p_idx in iterator:
-            op = self._par_info[p_idx]["op"]
-            op_idx = self._par_info[p_idx]["p_idx"]
-            params.append(op.data[op_idx])
+            info = par_info[p_idx]
+            params.append(info["op"].data[info["p_idx"]])
         return params
 
     def set_parameters(self, params, trainable_only=True):
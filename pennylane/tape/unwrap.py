@@ -14,7 +14,9 @@
 """
 This module contains a context manager for unwrapping tapes
 """
-import contextlib
+# pylint: disable=protected-access
+import sys
+
 import pennylane as qml
 
 
@@ -70,32 +72,46 @@ class Unwrap:
     >>> print("Original parameters:", tape1.get_parameters())
     Original parameters: [tensor(0.1000, dtype=torch.float64, grad_fn=<SelectBackward>),
       tensor(0.3000, dtype=torch.float64, grad_fn=<SelectBackward>)]
+
+    .. note::
+
+        Parameters are restored on exit as described in :class:`~.UnwrapTape`;
+        only parameters that were replaced on entry are restored.
     """
 
     def __init__(self, *tapes, params=None, set_trainable=True):
         self.tapes = tapes
-        self.stack = None
+        self.unwrapped_tapes = None
         self.params = params
         self.set_trainable = set_trainable
 
     def __enter__(self):
-        with contextlib.ExitStack() as stack:
+        # Restoring the original tape parameters never raises, so the
+        # unwrapped tapes are tracked in a plain list rather than an ExitStack.
+        self.unwrapped_tapes = []
+
+        try:
             for i, tape in enumerate(self.tapes):
-                stack.enter_context(
-                    UnwrapTape(
-                        tape,
-                        params=self.params[i] if self.params is not None else None,
-                        set_trainable=self.set_trainable,
-                    )
+                unwrapped_tape = UnwrapTape(
+                    tape,
+                    params=self.params[i] if self.params is not None else None,
+                    set_trainable=self.set_trainable,
                 )
+                unwrapped_tape.__enter__()
+                self.unwrapped_tapes.append(unwrapped_tape)
 
-            self.stack = stack.pop_all()
+        except BaseException:
+            # restore the tapes that were unwrapped prior to the exception
+            self.__exit__(*sys.exc_info())
+            raise
 
         return self.tapes
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self.stack.__exit__(exception_type, exception_value, traceback)
-        self.stack = None
+        for unwrapped_tape in reversed(self.unwrapped_tapes):
+            unwrapped_tape.__exit__(exception_type, exception_value, traceback)
+
+        self.unwrapped_tapes = None
 
 
 class UnwrapTape:
@@ -128,18 +144,46 @@ class UnwrapTape:
     >>> print("Original parameters:", tape.get_parameters())
     Original parameters: [<tf.Variable 'Variable:0' shape=() dtype=float32, numpy=0.1>,
       <tf.Variable 'Variable:0' shape=() dtype=float32, numpy=0.3>]
+
+    .. note::
+
+        Only parameters that are replaced by a different object on entry (for
+        example, unwrapped tensors, but not Python floats) are restored on
+        exit. Changes made within the context to parameters that were not
+        replaced, such as via :meth:`~.QuantumTape.set_parameters`, persist
+        after the context exits.
     """
 
     def __init__(self, tape, params=None, set_trainable=True):
         self.tape = tape
         self._original_params = None
         self._unwrapped_params = params or None
+        self._replaced_params = None
         self.set_trainable = set_trainable
 
     def __enter__(self):
-        self._original_params = self.tape.get_parameters(trainable_only=False)
-        self._unwrapped_params = self._unwrapped_params or qml.math.unwrap(self._original_params)
-        self.tape.set_parameters(self._unwrapped_params, trainable_only=False)
+        # Record the location and value of each tape parameter in a single pass
+        # over the parameter information, so that the parameters can be unwrapped
+        # and later restored without repeatedly querying the tape.
+        locations = [(info["op"], info["p_idx"]) for info in self.tape._par_info.values()]
+        self._original_params = [op.data[p_idx] for op, p_idx in locations]
+
+        if self._unwrapped_params is None:
+            self._unwrapped_params = qml.math.unwrap(self._original_params)
+        elif len(self._unwrapped_params) != len(locations):
+            raise ValueError("Number of provided parameters does not match.")
+
+        # Only parameters that are replaced by a different object when unwrapped
+        # (for example, tensors but not Python floats) need to be set on the tape,
+        # and later restored.
+        self._replaced_params = []
+
+        for (op, p_idx), original, unwrapped in zip(
+            locations, self._original_params, self._unwrapped_params
+        ):
+            if unwrapped is not original:
+                op.data[p_idx] = unwrapped
+                self._replaced_params.append((op, p_idx, original))
 
         if self.set_trainable:
             # In addition to unwrapping the tape parameters, we also infer the
@@ -150,4 +194,5 @@ class UnwrapTape:
         return self.tape
 
     def __exit__(self, exception_type, exception_value, traceback):
-        self.tape.set_parameters(self._original_params, trainable_only=False)
+        for op, p_idx, original in self._replaced_params:
+            op.data[p_idx] = original
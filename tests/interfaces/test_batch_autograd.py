@@ -74,6 +74,27 @@ class TestAutogradExecuteUnitTests:
         for args in spy.call_args_list:
             assert args[1]["shift"] == np.pi / 4
 
+    def test_no_trainable_parameters_bypass(self, mocker):
+        """Test that the Autograd containers are only constructed
+        if the tapes have trainable parameters"""
+        spy = mocker.spy(autograd.builtins, "tuple")
+        dev = qml.device("default.qubit", wires=1)
+
+        def cost(a):
+            with qml.tape.JacobianTape() as tape:
+                qml.RY(a, wires=0)
+                qml.expval(qml.PauliZ(0))
+
+            return execute([tape], dev, gradient_fn=param_shift)[0]
+
+        res = cost(np.array(0.1, requires_grad=False))
+        assert np.allclose(res, np.cos(0.1))
+        spy.assert_not_called()
+
+        res = cost(np.array(0.1, requires_grad=True))
+        assert np.allclose(res, np.cos(0.1))
+        spy.assert_called()
+
     def test_incorrect_mode(self):
         """Test that an error is raised if a gradient transform
         is used with mode=forward"""
@@ -786,6 +807,42 @@ class TestHigherOrderDerivatives:
         )
         assert np.allclose(res, expected, atol=tol, rtol=0)
 
+    def test_first_order_no_recursion(self, mocker, tol):
+        """Test that computing a first-order derivative with max_diff=2 does
+        not recursively execute the gradient tapes via the Autograd interface"""
+        dev = qml.device("default.qubit", wires=1)
+        params = np.array([0.543, -0.654], requires_grad=True)
+
+        def cost_fn(x):
+            with qml.tape.JacobianTape() as tape:
+                qml.RX(x[0], wires=0)
+                qml.RY(x[1], wires=0)
+                qml.expval(qml.PauliZ(0))
+
+            return execute([tape], dev, gradient_fn=param_shift, max_diff=2)[0]
+
+        spy = mocker.spy(importlib.import_module("pennylane.interfaces.batch.autograd"), "execute")
+
+        res = qml.grad(cost_fn)(params)
+        x, y = params
+        expected = np.array([-np.sin(x) * np.cos(y), -np.cos(x) * np.sin(y)])
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+        assert spy.call_count == 1
+
+        res = qml.jacobian(qml.grad(cost_fn))(params)
+        expected = np.array(
+            [
+                [-np.cos(x) * np.cos(y), np.sin(x) * np.sin(y)],
+                [np.sin(x) * np.sin(y), -np.cos(x) * np.cos(y)],
+            ]
+        )
+        assert np.allclose(res, expected, atol=tol, rtol=0)
+
+        # the Hessian requires exactly one outer execution, and one nested
+        # execution of the gradient tapes in the backward pass
+        assert spy.call_count == 3
+        assert [c[1]["_n"] for c in spy.call_args_list] == [1, 1, 2]
+
     def test_adjoint_hessian(self, tol):
         """Since the adjoint hessian is not a differentiable transform,
         higher-order derivatives are not supported."""
@@ -1614,6 +1614,19 @@ class TestUnwrap:
         assert all(np.allclose(a, b) for a, b in zip(unwrapped_params, expected))
         assert all(not isinstance(a, np.tensor) for a in unwrapped_params)
 
+    def test_scalar_and_tensor_unwrapping(self):
+        """Test that Python scalars are returned unchanged, and that PennyLane
+        tensors and NumPy arrays are unwrapped to NumPy arrays or Python scalars"""
+        values = [0.1, 2, np.tensor(0.3), np.tensor([0.5, 0.2]), onp.array(0.4), onp.float64(0.6)]
+        res = qml.math.unwrap(values)
+
+        assert res[:3] == [0.1, 2, 0.3]
+        assert all(isinstance(r, t) for r, t in zip(res[:3], (float, int, float)))
+        assert isinstance(res[3], onp.ndarray) and not isinstance(res[3], np.tensor)
+        assert np.allclose(res[3], [0.5, 0.2])
+        assert res[4:] == [0.4, 0.6]
+        assert all(isinstance(r, float) for r in res[4:])
+
     def test_autograd_unwrapping_backward(self):
         """Test that a sequence of Autograd values is properly unwrapped
         during the backward pass"""
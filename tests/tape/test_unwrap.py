@@ -250,3 +250,56 @@ def test_multiple_unwrap():
     # outside the context, the original parameters have been restored.
     assert tape1.get_parameters(trainable_only=False) == p
     assert tape2.get_parameters(trainable_only=False) == [p[1], p[3], p[0], p[2]]
+
+
+def test_multiple_unwrap_exception():
+    """Test that if unwrapping one of multiple tapes fails, the tapes
+    that have already been unwrapped are restored"""
+    from pennylane import numpy as anp
+
+    p = [anp.tensor(0.1, requires_grad=True), anp.tensor(0.2, requires_grad=False)]
+
+    with qml.tape.QuantumTape() as tape1:
+        qml.RX(p[0], wires=0)
+
+    with qml.tape.QuantumTape() as tape2:
+        qml.RX(p[1], wires=0)
+
+    with pytest.raises(ValueError, match="Number of provided parameters does not match"):
+        with qml.tape.Unwrap(tape1, tape2, params=[[0.5], [0.6, 0.7]]):
+            pass
+
+    # the parameters of the first tape have been restored
+    assert tape1.get_parameters(trainable_only=False) == [p[0]]
+    assert tape2.get_parameters(trainable_only=False) == [p[1]]
+
+
+def test_unwrap_only_replaced_parameters_restored():
+    """Test that parameters which are unchanged by unwrapping are
+    not reset on the tape, so that changes made to them within the
+    context persist"""
+    from pennylane import numpy as anp
+
+    p = [anp.tensor(0.1, requires_grad=True), 0.2]
+
+    with qml.tape.QuantumTape() as tape:
+        qml.RX(p[0], wires=0)
+        qml.RY(p[1], wires=0)
+
+    with qml.tape.UnwrapTape(tape):
+        params = tape.get_parameters(trainable_only=False)
+        assert params == [0.1, 0.2]
+        assert params[1] is p[1]
+
+    params = tape.get_parameters(trainable_only=False)
+    assert params[0] is p[0]
+    assert params[1] is p[1]
+
+    with qml.tape.UnwrapTape(tape):
+        tape.set_parameters([0.9, 0.8], trainable_only=False)
+
+    # the replaced tensor parameter is restored, while the
+    # change to the non-replaced float parameter persists
+    params = tape.get_parameters(trainable_only=False)
+    assert params[0] is p[0]
+    assert params[1] == 0.8